@@ -2,55 +2,102 @@
 
 from __future__ import annotations
 
+import logging
 import os
 import shlex
-import subprocess
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, NoReturn
 
 import typer
 
-# Use tomllib from stdlib in Python 3.11+, otherwise fall back to tomli
-if sys.version_info >= (3, 11):
-    import tomllib
-else:
-    import tomli as tomllib
+logger = logging.getLogger(__name__)
 
 # Default configuration values
 DEFAULT_BOTTLE_NAME = 'SPSS'
 DEFAULT_PROGRAM_NAME = 'SPSS'
 DEFAULT_FLATPAK_APP_ID = 'com.usebottles.bottles'
-CONFIG_FILE_PATH = Path.home() / '.config' / 'spss-wrapper' / 'config.toml'
-LOG_DIR_PATH = Path.home() / '.local' / 'share' / 'spss-wrapper' / 'logs'
+# Looked up once and shared by the paths below
+_HOME = Path.home()
+CONFIG_FILE_PATH = _HOME / '.config' / 'spss-wrapper' / 'config.toml'
+LOG_DIR_PATH = _HOME / '.local' / 'share' / 'spss-wrapper' / 'logs'
 
+# Linux path prefixes that Wine exposes unchanged under the Z: drive. Paths
+# are matched after realpath(), so /var/home (where /home is a symlink, as on
+# Fedora Silverblue/Kinoite) and /run/media (removable media) are listed too.
+FAST_PATH_PREFIXES = ('/home/', '/var/home/', '/mnt/', '/media/', '/run/media/')
+# Characters that Wine would mangle when mapping a name to Windows
+WINDOWS_RESERVED_CHARS = frozenset('<>:"\\|?*')
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class Config:
     """Configuration for the SPSS wrapper."""
 
     bottle_name: str
     program_name: str
     flatpak_app_id: str
+    # Command prefix for running bottles-cli through Flatpak
+    bottles_cli_prefix: tuple[str, ...] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            'bottles_cli_prefix',
+            ('flatpak', 'run', '--command=bottles-cli', self.flatpak_app_id),
+        )
+
+
+# Parsed config files, keyed by (path, mtime in ns, size)
+_config_cache: dict[tuple[str, int, int], dict[str, str]] = {}
 
 
 def load_config_file() -> dict[str, str]:
-    """Load configuration from the config file if it exists."""
-    if not CONFIG_FILE_PATH.exists():
+    """Load configuration from the config file if it exists.
+
+    The parsed result is cached until the file's modification time or size
+    changes.
+    """
+    try:
+        st = os.stat(CONFIG_FILE_PATH)
+    except (FileNotFoundError, NotADirectoryError):
         return {}
+    except OSError as e:
+        typer.echo(
+            f'Warning: Failed to read config file {CONFIG_FILE_PATH}: {e}',
+            err=True,
+        )
+        return {}
+
+    # Imported here so runs without a config file never pay for it.
+    # Use tomllib from stdlib in Python 3.11+, otherwise fall back to tomli
+    if sys.version_info >= (3, 11):
+        import tomllib
+    else:
+        import tomli as tomllib
+
+    key = (str(CONFIG_FILE_PATH), st.st_mtime_ns, st.st_size)
+    cached = _config_cache.get(key)
+    if cached is not None:
+        return cached
 
     try:
-        with CONFIG_FILE_PATH.open('rb') as f:
-            return tomllib.load(f)
-    except (OSError, tomllib.TOMLDecodeError) as e:
+        data = CONFIG_FILE_PATH.read_bytes()
+        file_config = tomllib.loads(data.decode('utf-8'))
+    except (OSError, UnicodeDecodeError, tomllib.TOMLDecodeError) as e:
         typer.echo(
             f'Warning: Failed to read config file {CONFIG_FILE_PATH}: {e}',
             err=True,
         )
         return {}
 
+    _config_cache[key] = file_config
+    return file_config
+
 
 def create_config_file(
     bottle_name: str,
@@ -65,7 +112,9 @@ def create_config_file(
         raise typer.Exit(1)
 
     # Create parent directory if it doesn't exist
-    CONFIG_FILE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    parent = CONFIG_FILE_PATH.parent
+    if not parent.is_dir():
+        parent.mkdir(parents=True, exist_ok=True)
 
     config_content = f'''# SPSS Wrapper Configuration
 # Values here are overridden by environment variables and CLI flags.
@@ -89,28 +138,31 @@ def get_config(
     flatpak_app_id_override: str | None = None,
 ) -> Config:
     """Get configuration with priority: CLI flags > env vars > config file > defaults."""
-    file_config = load_config_file()
+    env = os.environ
 
-    bottle_name = (
-        bottle_override
-        or os.environ.get('SPSS_BOTTLE_NAME')
-        or file_config.get('bottle_name')
-        or DEFAULT_BOTTLE_NAME
+    bottle_name = bottle_override or env.get('SPSS_BOTTLE_NAME')
+    program_name = program_override or env.get('SPSS_PROGRAM_NAME')
+    flatpak_app_id = flatpak_app_id_override or env.get(
+        'BOTTLES_FLATPAK_APP_ID'
     )
 
-    program_name = (
-        program_override
-        or os.environ.get('SPSS_PROGRAM_NAME')
-        or file_config.get('program_name')
-        or DEFAULT_PROGRAM_NAME
-    )
+    # Only read the config file if something is still left to fill in
+    if not (bottle_name and program_name and flatpak_app_id):
+        file_config = load_config_file()
 
-    flatpak_app_id = (
-        flatpak_app_id_override
-        or os.environ.get('BOTTLES_FLATPAK_APP_ID')
-        or file_config.get('flatpak_app_id')
-        or DEFAULT_FLATPAK_APP_ID
-    )
+        bottle_name = (
+            bottle_name or file_config.get('bottle_name') or DEFAULT_BOTTLE_NAME
+        )
+        program_name = (
+            program_name
+            or file_config.get('program_name')
+            or DEFAULT_PROGRAM_NAME
+        )
+        flatpak_app_id = (
+            flatpak_app_id
+            or file_config.get('flatpak_app_id')
+            or DEFAULT_FLATPAK_APP_ID
+        )
 
     return Config(
         bottle_name=bottle_name,
@@ -119,37 +171,61 @@ def get_config(
     )
 
 
-def resolve_and_validate_path(file_path: str) -> Path:
+def resolve_and_validate_path(file_path: str) -> str:
     """Resolve a path to absolute and validate that it exists."""
-    path = Path(file_path).resolve()
+    path = os.path.realpath(file_path)
 
-    if not path.exists():
+    try:
+        os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
         typer.echo(f'Error: File does not exist: {path}', err=True)
         raise typer.Exit(1)
 
     return path
 
 
-def translate_path_to_windows(
-    linux_path: Path,
+def fast_translate(linux_path: str) -> str | None:
+    """Translate a Linux path to its Z: drive Windows path without winepath.
+
+    Returns None if the path is not under one of ``FAST_PATH_PREFIXES`` or
+    contains characters Wine would have to mangle, in which case winepath
+    must be used instead.
+    """
+    if not linux_path.startswith(FAST_PATH_PREFIXES):
+        return None
+
+    if not WINDOWS_RESERVED_CHARS.isdisjoint(linux_path):
+        return None
+
+    return 'Z:' + linux_path.replace('/', '\\')
+
+
+def translate_paths_to_windows(
+    linux_paths: list[str],
     config: Config,
-    verbose: bool = False,
-) -> str:
-    """Translate a Linux path to a Windows path using winepath in the bottle."""
+) -> list[str]:
+    """Translate Linux paths to Windows paths using one winepath call.
+
+    All paths are passed to a single ``winepath -w`` run in the bottle, which
+    prints one line per path (empty on failure), so that the Flatpak/Bottles
+    startup cost is paid only once regardless of how many files are given.
+    """
+    if not linux_paths:
+        return []
+
+    import subprocess
+
+    winepath_command = 'winepath -w ' + ' '.join(map(shlex.quote, linux_paths))
     cmd = [
-        'flatpak',
-        'run',
-        '--command=bottles-cli',
-        config.flatpak_app_id,
+        *config.bottles_cli_prefix,
         'shell',
         '-b',
         config.bottle_name,
         '-i',
-        f'winepath -w {shlex.quote(str(linux_path))}',
+        winepath_command,
     ]
 
-    if verbose:
-        typer.echo(f'Running winepath command: {" ".join(cmd)}')
+    logger.debug('Running winepath command: %s', ' '.join(cmd))
 
     try:
         result = subprocess.run(
@@ -158,26 +234,11 @@ def translate_path_to_windows(
             text=True,
             check=True,
         )
-        windows_path = result.stdout.strip()
-
-        if not windows_path:
-            typer.echo(
-                f'Error: winepath returned empty result for {linux_path}\n\n'
-                'This may indicate:\n'
-                '  - The bottle is not properly configured\n'
-                '  - The path is not accessible from within the bottle\n\n'
-                'Try running manually:\n'
-                f'  flatpak run --command=bottles-cli {config.flatpak_app_id} '
-                f'shell -b {config.bottle_name} -i "winepath -w \'{linux_path}\'"',
-                err=True,
-            )
-            raise typer.Exit(1)
-
-        return windows_path
-
     except subprocess.CalledProcessError as e:
         typer.echo(
-            f"Error: Failed to translate path '{linux_path}' to Windows format.\n\n"
+            'Error: Failed to translate '
+            + ', '.join(f"'{linux_path}'" for linux_path in linux_paths)
+            + ' to Windows format.\n\n'
             f'Command failed with exit code {e.returncode}\n'
             f'stdout: {e.stdout}\n'
             f'stderr: {e.stderr}\n\n'
@@ -202,37 +263,111 @@ def translate_path_to_windows(
         )
         raise typer.Exit(1)
 
+    # winepath prints one line per path; keep the last ones in case anything
+    # else was printed first, and pad so every path gets a diagnostic.
+    outputs = result.stdout.splitlines()
+    if len(outputs) > len(linux_paths):
+        outputs = outputs[-len(linux_paths) :]
+    outputs += [''] * (len(linux_paths) - len(outputs))
+
+    windows_paths: list[str] = []
+
+    for linux_path, output in zip(linux_paths, outputs):
+        windows_path = output.strip()
+
+        if not windows_path:
+            manual_cmd = shlex.join(
+                [
+                    *config.bottles_cli_prefix,
+                    'shell',
+                    '-b',
+                    config.bottle_name,
+                    '-i',
+                    f'winepath -w {shlex.quote(linux_path)}',
+                ]
+            )
+            typer.echo(
+                f'Error: winepath returned empty result for {linux_path}\n\n'
+                'This may indicate:\n'
+                '  - The bottle is not properly configured\n'
+                '  - The path is not accessible from within the bottle\n\n'
+                'Try running manually:\n'
+                f'  {manual_cmd}',
+                err=True,
+            )
+            raise typer.Exit(1)
+
+        windows_paths.append(windows_path)
+
+    return windows_paths
+
 
 def build_spss_command(
     config: Config,
     windows_paths: list[str],
 ) -> list[str]:
     """Build the command to launch SPSS with the given files."""
-    cmd = [
-        'flatpak',
-        'run',
-        '--command=bottles-cli',
-        config.flatpak_app_id,
+    return [
+        *config.bottles_cli_prefix,
         'run',
         '-b',
         shlex.quote(config.bottle_name),
         '-p',
         config.program_name,
+        *map(shlex.quote, windows_paths),
     ]
 
-    if windows_paths:
-        cmd.extend(map(shlex.quote, windows_paths))
-
-    return cmd
-
 
 def get_log_file_path() -> Path:
     """Create log directory and return path for a new timestamped log file."""
-    LOG_DIR_PATH.mkdir(parents=True, exist_ok=True)
+    if not LOG_DIR_PATH.is_dir():
+        LOG_DIR_PATH.mkdir(parents=True, exist_ok=True)
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     return LOG_DIR_PATH / f'spss_{timestamp}.log'
 
 
+def exec_spss_command(cmd: list[str], log_file: Path | None) -> NoReturn:
+    """Replace the current process with the SPSS launch command.
+
+    If a log file is given, stdout and stderr are redirected to it before the
+    exec. SPSS's exit code becomes the wrapper's exit code.
+    """
+    saved_fds = None
+
+    # Anything still buffered would be lost when the process image is replaced
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    if log_file is not None:
+        log_fd = os.open(log_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        # Keep the terminal's stdout/stderr so errors can still be reported
+        # there if the exec fails.
+        saved_fds = (os.dup(1), os.dup(2))
+        os.dup2(log_fd, 1)
+        os.dup2(log_fd, 2)
+        os.close(log_fd)
+
+    try:
+        os.execvp(cmd[0], cmd)
+    except OSError as e:
+        if saved_fds is not None:
+            os.dup2(saved_fds[0], 1)
+            os.dup2(saved_fds[1], 2)
+
+        if isinstance(e, FileNotFoundError):
+            typer.echo(
+                "Error: 'flatpak' command not found.\n\n"
+                'Please ensure Flatpak is installed:\n'
+                '  Ubuntu/Debian: sudo apt install flatpak\n'
+                '  Fedora: sudo dnf install flatpak\n'
+                '  Arch: sudo pacman -S flatpak',
+                err=True,
+            )
+        else:
+            typer.echo(f"Error: Failed to run '{cmd[0]}': {e}", err=True)
+        raise typer.Exit(1)
+
+
 app = typer.Typer(
     help='Launch IBM SPSS through Bottles on Linux.',
     add_completion=False,
@@ -308,8 +443,24 @@ def main(
             help='Show Bottles/Wine output in terminal instead of logging to file.',
         ),
     ] = False,
+    no_fast_path: Annotated[
+        bool,
+        typer.Option(
+            '--no-fast-path',
+            help='Always translate paths with winepath, even under /home, '
+            '/mnt, /media and similar locations.',
+        ),
+    ] = False,
 ) -> None:
     """Launch IBM SPSS through Bottles, optionally opening files."""
+    # Configure only this module's logger, replacing any handler from an
+    # earlier call so the current stderr and verbosity are used.
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.handlers[:] = [handler]
+    logger.setLevel(logging.DEBUG if verbose else logging.WARNING)
+    logger.propagate = False
+
     config = get_config(
         bottle_override=bottle,
         program_override=program,
@@ -325,76 +476,63 @@ def main(
         )
         return
 
-    if verbose:
-        typer.echo('Configuration:')
-        typer.echo(f'  Bottle: {config.bottle_name}')
-        typer.echo(f'  Program: {config.program_name}')
-        typer.echo(f'  Flatpak App ID: {config.flatpak_app_id}')
+    logger.debug(
+        'Configuration:\n  Bottle: %s\n  Program: %s\n  Flatpak App ID: %s',
+        config.bottle_name,
+        config.program_name,
+        config.flatpak_app_id,
+    )
 
     windows_paths: list[str] = []
 
     if files:
+        linux_paths: list[str] = []
+
         for file_path in files:
             linux_path = resolve_and_validate_path(file_path)
 
-            if verbose:
-                typer.echo(f'Resolved path: {file_path} -> {linux_path}')
-
-            windows_path = translate_path_to_windows(
-                linux_path, config, verbose
+            logger.debug('Resolved path: %s -> %s', file_path, linux_path)
+
+            linux_paths.append(linux_path)
+
+        fast_paths = [
+            None if no_fast_path else fast_translate(linux_path)
+            for linux_path in linux_paths
+        ]
+        translated = iter(
+            translate_paths_to_windows(
+                [
+                    linux_path
+                    for linux_path, fast_path in zip(linux_paths, fast_paths)
+                    if fast_path is None
+                ],
+                config,
             )
+        )
+        windows_paths = [
+            fast_path if fast_path is not None else next(translated)
+            for fast_path in fast_paths
+        ]
 
-            if verbose:
-                typer.echo(f'Windows path: {windows_path}')
-
-            windows_paths.append(windows_path)
+        for windows_path in windows_paths:
+            logger.debug('Windows path: %s', windows_path)
 
     cmd = build_spss_command(config, windows_paths)
 
-    if dry_run or verbose:
-        typer.echo(f'Command: {" ".join(cmd)}')
-
     if dry_run:
+        typer.echo(f'Command: {" ".join(cmd)}')
         return
 
-    if show_output:
-        try:
-            subprocess.run(cmd, check=True)
-        except subprocess.CalledProcessError as e:
-            typer.echo(f'Error: SPSS exited with code {e.returncode}', err=True)
-            raise typer.Exit(e.returncode)
-        except FileNotFoundError:
-            typer.echo(
-                "Error: 'flatpak' command not found.\n\n"
-                'Please ensure Flatpak is installed:\n'
-                '  Ubuntu/Debian: sudo apt install flatpak\n'
-                '  Fedora: sudo dnf install flatpak\n'
-                '  Arch: sudo pacman -S flatpak',
-                err=True,
-            )
-            raise typer.Exit(1)
-    else:
+    logger.debug('Command: %s', ' '.join(cmd))
+
+    log_file = None
+
+    if not show_output:
         log_file = get_log_file_path()
-        if verbose:
-            typer.echo(f'Log file: {log_file}')
-
-        try:
-            with log_file.open('w') as log:
-                subprocess.run(cmd, stdout=log, stderr=log, check=True)
-        except subprocess.CalledProcessError as e:
-            typer.echo(f'Error: SPSS exited with code {e.returncode}', err=True)
-            typer.echo(f'See log file for details: {log_file}', err=True)
-            raise typer.Exit(e.returncode)
-        except FileNotFoundError:
-            typer.echo(
-                "Error: 'flatpak' command not found.\n\n"
-                'Please ensure Flatpak is installed:\n'
-                '  Ubuntu/Debian: sudo apt install flatpak\n'
-                '  Fedora: sudo dnf install flatpak\n'
-                '  Arch: sudo pacman -S flatpak',
-                err=True,
-            )
-            raise typer.Exit(1)
+        # Always shown, since errors from SPSS only end up in the log
+        typer.echo(f'Log file: {log_file}', err=True)
+
+    exec_spss_command(cmd, log_file)
 
 
 if __name__ == '__main__':